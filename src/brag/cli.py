@@ -1,14 +1,12 @@
 """CLI commands for brag."""
 
 import functools
+import itertools
 import sys
 from datetime import date
 
 import click
-import questionary
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
+from rich.console import Console, Group, RenderableType
 
 from . import __version__
 from .config import (
@@ -21,7 +19,7 @@ from .config import (
     is_initialized,
     save_config,
 )
-from .models import Entry
+from .models import Entry, parse_tags
 from .storage import get_entries_filtered, get_week_number, add_entry as storage_add_entry
 
 console = Console()
@@ -121,6 +119,11 @@ def add_entry_cmd():
       4. Add optional tags
       5. Preview and confirm
     """
+    # Interactive-only dependencies are slow to import, so load them here
+    import questionary
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
     if not is_initialized():
         console.print(
             "[red]Error:[/red] Brag directory not initialized.\n"
@@ -178,9 +181,7 @@ def add_entry_cmd():
         "Tags? (optional, comma-separated)\n",
     ).ask()
 
-    tags = []
-    if tags_input:
-        tags = [t.strip() for t in tags_input.split(",") if t.strip()]
+    tags = parse_tags(tags_input) if tags_input else ()
 
     # Create entry
     entry = Entry(
@@ -278,26 +279,25 @@ def list_entries(week, month, quarter, semester, year, topic):
 
     filter_desc = " | ".join(filter_parts)
 
-    console.print()
-    console.print(f"[bold]Entries[/bold] ({filter_desc})")
-    console.print()
-
-    # Group by date
-    entries_by_date: dict[date, list[Entry]] = {}
-    for entry in entries:
-        if entry.entry_date not in entries_by_date:
-            entries_by_date[entry.entry_date] = []
-        entries_by_date[entry.entry_date].append(entry)
-
-    for entry_date in sorted(entries_by_date.keys()):
-        console.print(f"[bold blue]## {entry_date.isoformat()}[/bold blue]")
-        for entry in entries_by_date[entry_date]:
-            console.print(f"[bold]{entry.title}[/bold]")
-            console.print(f"  • [dim]Topic:[/dim] {entry.topic}")
-            console.print(f"  • [dim]Impact:[/dim] {entry.impact}")
+    # Build the whole listing and print it once
+    renderables: list[RenderableType] = [
+        "",
+        f"[bold]Entries[/bold] ({filter_desc})",
+        "",
+    ]
+
+    # Entries come back sorted by date, so consecutive runs share a date
+    for entry_date, group in itertools.groupby(entries, key=lambda e: e.entry_date):
+        renderables.append(f"[bold blue]## {entry_date.isoformat()}[/bold blue]")
+        for entry in group:
+            renderables.append(f"[bold]{entry.title}[/bold]")
+            renderables.append(f"  • [dim]Topic:[/dim] {entry.topic}")
+            renderables.append(f"  • [dim]Impact:[/dim] {entry.impact}")
             if entry.tags:
-                console.print(f"  • [dim]Tags:[/dim] {', '.join(entry.tags)}")
-            console.print()
+                renderables.append(f"  • [dim]Tags:[/dim] {', '.join(entry.tags)}")
+            renderables.append("")
+
+    console.print(Group(*renderables))
 
 
 @main.group()
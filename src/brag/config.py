@@ -1,9 +1,14 @@
 """Configuration management for brag."""
 
+import copy
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from types import ModuleType
 
-import yaml
+# Parsed config.yaml contents keyed by path, with the (mtime_ns, size) they were read at
+_CONFIG_CACHE: dict[str, tuple[int, int, dict]] = {}
 
 
 class ConfigError(Exception):
@@ -12,11 +17,32 @@ class ConfigError(Exception):
     pass
 
 
-def get_brag_dir() -> Path:
-    """Get the brag directory from environment variable.
+@dataclass(frozen=True)
+class BragPaths:
+    """Resolved locations inside a brag directory."""
+
+    brag_dir: Path
+    config_path: Path
+    entries_dir: Path
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_paths(brag_dir: str) -> BragPaths:
+    """Resolve the brag paths for a BRAG_DIR value.
+
+    Cached on the raw environment value, so changing BRAG_DIR yields fresh
+    paths while repeated lookups skip the ~ expansion and Path building.
+    """
+    root = Path(brag_dir).expanduser()
+    return BragPaths(
+        brag_dir=root,
+        config_path=root / "config.yaml",
+        entries_dir=root / "entries",
+    )
 
-    Returns:
-        Path to the brag directory.
+
+def _paths() -> BragPaths:
+    """Get the brag paths for the current BRAG_DIR.
 
     Raises:
         ConfigError: If BRAG_DIR is not set.
@@ -28,22 +54,59 @@ def get_brag_dir() -> Path:
             "Please set it to the directory where you want to store your brag documents:\n"
             "  export BRAG_DIR=~/Documents/brag"
         )
-    return Path(brag_dir).expanduser()
+    return _resolve_paths(brag_dir)
+
+
+def get_brag_dir() -> Path:
+    """Get the brag directory from environment variable.
+
+    Returns:
+        Path to the brag directory.
+
+    Raises:
+        ConfigError: If BRAG_DIR is not set.
+    """
+    return _paths().brag_dir
 
 
 def get_config_path() -> Path:
     """Get the path to config.yaml."""
-    return get_brag_dir() / "config.yaml"
+    return _paths().config_path
 
 
 def get_entries_dir() -> Path:
     """Get the path to the entries directory."""
-    return get_brag_dir() / "entries"
+    return _paths().entries_dir
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml() -> tuple[ModuleType, type, type]:
+    """Import PyYAML on first use and pick its fastest safe loader and dumper.
+
+    Only commands that read or write config.yaml need PyYAML, so importing
+    it lazily keeps it off the startup path of commands like `brag list`.
+
+    Returns:
+        Tuple of (yaml module, Loader class, Dumper class).
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeDumper as Dumper
+        from yaml import SafeLoader as Loader
+
+    return yaml, Loader, Dumper
 
 
 def load_config() -> dict:
     """Load configuration from config.yaml.
 
+    The parsed file is cached in-process and reused until its mtime or size
+    changes.
+
     Returns:
         Configuration dictionary.
 
@@ -51,16 +114,26 @@ def load_config() -> dict:
         ConfigError: If config file doesn't exist or is invalid.
     """
     config_path = get_config_path()
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         raise ConfigError(
             f"Configuration file not found at {config_path}.\n"
             "Run 'brag init' to initialize your brag directory."
-        )
+        ) from None
 
+    # Reuse the parsed config while the file on disk is unchanged
+    key = str(config_path)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(cached[2])
+
+    yaml, loader, _ = _yaml()
     with open(config_path) as f:
-        config = yaml.safe_load(f) or {}
+        config = yaml.load(f, Loader=loader) or {}
 
-    return config
+    _CONFIG_CACHE[key] = (st.st_mtime_ns, st.st_size, config)
+    return copy.deepcopy(config)
 
 
 def save_config(config: dict) -> None:
@@ -70,8 +143,12 @@ def save_config(config: dict) -> None:
         config: Configuration dictionary to save.
     """
     config_path = get_config_path()
+    _CONFIG_CACHE.pop(str(config_path), None)
+    yaml, _, dumper = _yaml()
     with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config, f, Dumper=dumper, default_flow_style=False, sort_keys=False
+        )
 
 
 def get_topics() -> list[str]:
@@ -111,9 +188,7 @@ def is_initialized() -> bool:
         True if initialized, False otherwise.
     """
     try:
-        brag_dir = get_brag_dir()
-        config_path = brag_dir / "config.yaml"
-        entries_dir = brag_dir / "entries"
-        return config_path.exists() and entries_dir.exists()
+        paths = _paths()
     except ConfigError:
         return False
+    return paths.config_path.exists() and paths.entries_dir.exists()
@@ -4,31 +4,76 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
+# Maps the bold label of an entry bullet ("- **<label>:**") to its field name
+_FIELD_LABELS = {
+    "Topic": "topic",
+    "Impact": "impact",
+    "Tags": "tags",
+}
 
-@dataclass
+
+def parse_field(line: str) -> Optional[tuple[str, str]]:
+    """Parse an entry bullet such as ``- **Topic:** Project Alpha``.
+
+    Args:
+        line: Stripped line from an entry.
+
+    Returns:
+        Tuple of (field name, value), or None if the line is not an entry field.
+    """
+    if not line.startswith("- **"):
+        return None
+    label, sep, value = line[4:].partition(":**")
+    name = _FIELD_LABELS.get(label)
+    if not sep or name is None:
+        return None
+    return name, value.strip()
+
+
+def parse_tags(value: str) -> tuple[str, ...]:
+    """Split a comma-separated tags value into tags.
+
+    Args:
+        value: Raw tags value.
+
+    Returns:
+        Tuple of non-empty, stripped tags.
+    """
+    # Most entries have no tags or a single one, which need no splitting
+    if "," not in value:
+        tag = value.strip()
+        return (tag,) if tag else ()
+    return tuple(t.strip() for t in value.split(",") if t.strip())
+
+
+@dataclass(frozen=True, slots=True)
 class Entry:
-    """Represents a single brag entry."""
+    """Represents a single brag entry.
+
+    Entries are immutable so parsed entries can be shared between callers.
+    """
 
     title: str
     topic: str
     impact: str
-    tags: list[str] = field(default_factory=list)
+    tags: tuple[str, ...] = ()
     entry_date: date = field(default_factory=date.today)
 
+    def __post_init__(self) -> None:
+        # Accept any iterable of tags, e.g. a list, but store a tuple
+        if not isinstance(self.tags, tuple):
+            object.__setattr__(self, "tags", tuple(self.tags))
+
     def to_markdown(self) -> str:
         """Convert entry to markdown format.
 
         Returns:
             Markdown formatted string.
         """
-        lines = [
-            f"### {self.title}",
-            f"- **Topic:** {self.topic}",
-            f"- **Impact:** {self.impact}",
-        ]
+        markdown = f"### {self.title}\n- **Topic:** {self.topic}\n- **Impact:** {self.impact}"
         if self.tags:
-            lines.append(f"- **Tags:** {', '.join(self.tags)}")
-        return "\n".join(lines)
+            markdown = f"{markdown}\n- **Tags:** {', '.join(self.tags)}"
+        return markdown
 
     @classmethod
     def from_markdown(cls, markdown: str, entry_date: date) -> Optional["Entry"]:
@@ -46,29 +91,24 @@ class Entry:
             return None
 
         title = ""
-        topic = ""
-        impact = ""
-        tags: list[str] = []
+        fields = {"topic": "", "impact": "", "tags": ""}
 
         for line in lines:
             line = line.strip()
             if line.startswith("### "):
                 title = line[4:].strip()
-            elif line.startswith("- **Topic:**"):
-                topic = line.replace("- **Topic:**", "").strip()
-            elif line.startswith("- **Impact:**"):
-                impact = line.replace("- **Impact:**", "").strip()
-            elif line.startswith("- **Tags:**"):
-                tags_str = line.replace("- **Tags:**", "").strip()
-                tags = [t.strip() for t in tags_str.split(",") if t.strip()]
+                continue
+            parsed = parse_field(line)
+            if parsed:
+                fields[parsed[0]] = parsed[1]
 
         if not title:
             return None
 
         return cls(
             title=title,
-            topic=topic,
-            impact=impact,
-            tags=tags,
+            topic=fields["topic"],
+            impact=fields["impact"],
+            tags=parse_tags(fields["tags"]),
             entry_date=entry_date,
         )
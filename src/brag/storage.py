@@ -1,14 +1,27 @@
 """Storage operations for brag entries."""
 
+import os
 import re
+from bisect import bisect_left, bisect_right
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from .config import get_entries_dir
-from .models import Entry
+from .models import Entry, parse_field, parse_tags
 
+_DATE_HEADER_RE = re.compile(r"^## (\d{4}-\d{2}-\d{2})$", re.MULTILINE)
+_WEEK_FILE_RE = re.compile(r"^week-(\d+)\.md$")
 
+# Number of bytes read from the end of a week file when appending an entry
+_TAIL_BYTES = 4096
+
+# File names for every ISO week number
+_WEEK_FILENAMES = tuple(f"week-{week:02d}.md" for week in range(54))
+
+
+@lru_cache(maxsize=4096)
 def get_week_number(d: date) -> int:
     """Get ISO week number for a date.
 
@@ -32,7 +45,11 @@ def get_week_file_path(year: int, week: int) -> Path:
         Path to the week file.
     """
     entries_dir = get_entries_dir()
-    return entries_dir / str(year) / f"week-{week:02d}.md"
+    if 0 <= week < len(_WEEK_FILENAMES):
+        filename = _WEEK_FILENAMES[week]
+    else:
+        filename = f"week-{week:02d}.md"
+    return entries_dir / str(year) / filename
 
 
 def ensure_week_file(year: int, week: int) -> Path:
@@ -64,18 +81,44 @@ def add_entry(entry: Entry) -> None:
     year = entry.entry_date.year
     week = get_week_number(entry.entry_date)
     file_path = ensure_week_file(year, week)
+    entry_md = entry.to_markdown()
+
+    entry_iso = entry.entry_date.isoformat()
+    date_header = f"## {entry_iso}"
+
+    # Fast path: when the entry belongs at the end of the file, append it
+    # instead of rewriting the whole file. Appending writes native line
+    # endings, so a file using the other convention takes the rewrite below,
+    # which normalizes the whole file.
+    tail, whole_file = _read_tail(file_path)
+    native_endings = ("\r\n" in tail) == (os.linesep == "\r\n")
+    tail = tail.replace("\r\n", "\n")
+    date_headers = _DATE_HEADER_RE.findall(tail)
+    last_date = date_headers[-1] if date_headers else None
+    ends_cleanly = tail.endswith("\n") and not tail[-2:-1].isspace()
+    if native_endings and ends_cleanly:
+        if last_date == entry_iso:
+            with open(file_path, "a") as f:
+                f.write(f"{entry_md}\n")
+            return
+        # A new date section is only safe to append when this date has no
+        # section yet; sections are chronological, so a later date than the
+        # last header can't appear earlier in the file
+        is_new_date = whole_file or (last_date is not None and last_date < entry_iso)
+        if is_new_date and date_header not in tail:
+            with open(file_path, "a") as f:
+                f.write(f"\n{date_header}\n{entry_md}\n")
+            return
 
     # Read existing content
     with open(file_path) as f:
         content = f.read()
 
     # Check if date section exists
-    date_header = f"## {entry.entry_date.isoformat()}"
     if date_header not in content:
         content = content.rstrip() + f"\n\n{date_header}\n"
 
     # Add entry under the date section
-    entry_md = entry.to_markdown()
     content = content.rstrip() + f"\n{entry_md}\n"
 
     # Write back
@@ -83,62 +126,131 @@ def add_entry(entry: Entry) -> None:
         f.write(content)
 
 
+def _read_tail(file_path: Path) -> tuple[str, bool]:
+    """Read the last few kilobytes of a file.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        Tuple of the end of the file, starting at a line boundary and with
+        its line endings untouched, and whether the whole file was read.
+    """
+    with open(file_path, "rb") as f:
+        size = f.seek(0, 2)
+        offset = max(0, size - _TAIL_BYTES)
+        f.seek(offset)
+        tail = f.read().decode("utf-8", errors="ignore")
+
+    if offset:
+        # Drop the partial first line
+        tail = tail.partition("\n")[2]
+    return tail, offset == 0
+
+
 def parse_week_file(file_path: Path) -> list[Entry]:
     """Parse entries from a week file.
 
+    Parsed files are cached and only re-read when their mtime or size changes.
+
     Args:
         file_path: Path to the week file.
 
     Returns:
         List of entries.
     """
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
         return []
 
-    with open(file_path) as f:
-        content = f.read()
+    return list(_parse_week_file_cached(str(file_path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=128)
+def _parse_week_file_cached(
+    file_path: str, mtime_ns: int, size: int
+) -> tuple[Entry, ...]:
+    """Parse a week file, memoized on its path, mtime and size.
 
+    Args:
+        file_path: Path to the week file.
+        mtime_ns: Modification time of the file, part of the cache key.
+        size: Size of the file, part of the cache key.
+
+    Returns:
+        Tuple of entries.
+    """
     entries: list[Entry] = []
     current_date: Optional[date] = None
-    current_entry_lines: list[str] = []
-
-    for line in content.split("\n"):
-        # Check for date header
-        date_match = re.match(r"^## (\d{4}-\d{2}-\d{2})$", line)
-        if date_match:
-            # Save previous entry if exists
-            if current_entry_lines and current_date:
-                entry = Entry.from_markdown(
-                    "\n".join(current_entry_lines), current_date
-                )
-                if entry:
-                    entries.append(entry)
-                current_entry_lines = []
-
-            current_date = date.fromisoformat(date_match.group(1))
-            continue
-
-        # Check for entry header
-        if line.startswith("### "):
-            # Save previous entry if exists
-            if current_entry_lines and current_date:
-                entry = Entry.from_markdown(
-                    "\n".join(current_entry_lines), current_date
-                )
-                if entry:
-                    entries.append(entry)
-
-            current_entry_lines = [line]
-        elif current_entry_lines:
-            current_entry_lines.append(line)
+    title: Optional[str] = None
+    fields: dict[str, str] = {}
+
+    with open(file_path) as f:
+        for raw_line in f:
+            line = raw_line.rstrip("\n")
+            date_match = _DATE_HEADER_RE.match(line)
+
+            # An entry written before the first date header takes that date
+            if date_match and current_date is None:
+                current_date = _parse_date(date_match.group(1))
+                continue
+
+            # A date or entry header closes the entry in progress
+            if date_match or line.startswith("### "):
+                if title and current_date:
+                    entries.append(_build_entry(title, fields, current_date))
+                if date_match:
+                    current_date = _parse_date(date_match.group(1))
+                    title = None
+                else:
+                    title = line[4:].strip()
+                fields = {}
+                continue
+
+            if title is not None:
+                parsed = parse_field(line.strip())
+                if parsed:
+                    fields[parsed[0]] = parsed[1]
 
     # Don't forget the last entry
-    if current_entry_lines and current_date:
-        entry = Entry.from_markdown("\n".join(current_entry_lines), current_date)
-        if entry:
-            entries.append(entry)
+    if title and current_date:
+        entries.append(_build_entry(title, fields, current_date))
+
+    return tuple(entries)
 
-    return entries
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    """Parse an ISO date from a date header, sharing one date per value.
+
+    Args:
+        value: Date string in YYYY-MM-DD format.
+
+    Returns:
+        Parsed date.
+    """
+    return date.fromisoformat(value)
+
+
+def _build_entry(title: str, fields: dict[str, str], entry_date: date) -> Entry:
+    """Build an entry from a title and its parsed bullet fields.
+
+    Args:
+        title: Entry title.
+        fields: Field values keyed by field name.
+        entry_date: Date of the entry.
+
+    Returns:
+        Entry object.
+    """
+    return Entry(
+        title=title,
+        topic=fields.get("topic", ""),
+        impact=fields.get("impact", ""),
+        tags=parse_tags(fields.get("tags", "")),
+        entry_date=entry_date,
+    )
 
 
 def get_weeks_in_range(
@@ -207,69 +319,86 @@ def get_entries_filtered(
     today = date.today()
     filter_year = year or today.year
 
-    # Determine week range based on filters
-    if week is not None:
-        # Specific week
-        weeks = [(filter_year, week)]
-    elif month is not None:
-        # Month: find weeks that fall in this month
-        weeks = _get_weeks_for_month(filter_year, month)
+    # Month span covered by a month/quarter/semester filter
+    if month is not None:
+        start_month, end_month = month, month
     elif quarter is not None:
         # Quarter: months 1-3, 4-6, 7-9, 10-12
         start_month = (quarter - 1) * 3 + 1
         end_month = start_month + 2
-        weeks = []
-        for m in range(start_month, end_month + 1):
-            weeks.extend(_get_weeks_for_month(filter_year, m))
-        weeks = list(set(weeks))  # Remove duplicates
     elif semester is not None:
         # Semester: 1 = Jan-Jun, 2 = Jul-Dec
-        if semester == 1:
-            start_month, end_month = 1, 6
-        else:
-            start_month, end_month = 7, 12
-        weeks = []
-        for m in range(start_month, end_month + 1):
-            weeks.extend(_get_weeks_for_month(filter_year, m))
-        weeks = list(set(weeks))  # Remove duplicates
+        start_month, end_month = (1, 6) if semester == 1 else (7, 12)
     else:
-        # Default to current week
-        weeks = [(today.year, get_week_number(today))]
-
-    # Collect entries from all relevant weeks
-    all_entries: list[Entry] = []
-    for y, w in sorted(set(weeks)):
-        entries = get_entries_for_week(y, w)
-        all_entries.extend(entries)
+        start_month, end_month = 1, 12
 
-    # Apply date filters for month/quarter/semester
-    if month is not None:
-        all_entries = [e for e in all_entries if e.entry_date.month == month]
-    elif quarter is not None:
-        start_month = (quarter - 1) * 3 + 1
-        end_month = start_month + 2
-        all_entries = [
-            e for e in all_entries if start_month <= e.entry_date.month <= end_month
-        ]
-    elif semester is not None:
-        if semester == 1:
-            all_entries = [e for e in all_entries if 1 <= e.entry_date.month <= 6]
-        else:
-            all_entries = [e for e in all_entries if 7 <= e.entry_date.month <= 12]
-
-    # Filter by topic if specified
-    if topic:
-        all_entries = [
-            e for e in all_entries if e.topic.lower() == topic.lower()
-        ]
-
-    # Sort by date
+    # Determine the week files to read based on filters. Entries are stored
+    # under their calendar year, so every filter reads a single year directory.
+    boundary_weeks: list[int] = []
+    if week is not None:
+        # Specific week
+        first_week = last_week = week
+    elif month is not None or quarter is not None or semester is not None:
+        # Consecutive months cover consecutive ISO weeks, so the span runs
+        # from the first week of the first month to the last of the last
+        first_iso_year, first_week = _get_weeks_for_month(filter_year, start_month)[0]
+        last_iso_year, last_week = _get_weeks_for_month(filter_year, end_month)[-1]
+        # Early January days can belong to the previous ISO year's week 52/53
+        # and late December days to the next ISO year's week 1; both are
+        # stored in this year's files under that week number
+        if first_iso_year < filter_year:
+            boundary_weeks.append(first_week)
+            first_week = 1
+        if last_iso_year > filter_year:
+            boundary_weeks.append(last_week)
+            last_week = 53
+    else:
+        # Default to current week
+        filter_year = today.year
+        first_week = last_week = get_week_number(today)
+
+    # Slice the weeks that have a file out of the sorted on-disk listing
+    existing = sorted(_existing_weeks(filter_year))
+    weeks = existing[bisect_left(existing, first_week) : bisect_right(existing, last_week)]
+    weeks += [w for w in boundary_weeks if w in existing]
+
+    # Collect matching entries from all relevant weeks in a single pass
+    topic_key = topic.casefold() if topic else None
+    all_entries = [
+        e
+        for w in weeks
+        for e in get_entries_for_week(filter_year, w)
+        if start_month <= e.entry_date.month <= end_month
+        and (topic_key is None or e.topic.casefold() == topic_key)
+    ]
+
+    # Sort by date (week files are already chronological, so this is a
+    # near-linear pass over presorted runs)
     all_entries.sort(key=lambda e: e.entry_date)
 
     return all_entries
 
 
-def _get_weeks_for_month(year: int, month: int) -> list[tuple[int, int]]:
+def _existing_weeks(year: int) -> set[int]:
+    """Get the week numbers that have a week file on disk for a year.
+
+    Args:
+        year: Year.
+
+    Returns:
+        Set of week numbers.
+    """
+    try:
+        with os.scandir(get_entries_dir() / str(year)) as it:
+            return {
+                int(m.group(1)) for e in it if (m := _WEEK_FILE_RE.match(e.name))
+            }
+    except FileNotFoundError:
+        return set()
+
+
+@lru_cache(maxsize=512)
+def _get_weeks_for_month(year: int, month: int) -> tuple[tuple[int, int], ...]:
     """Get all weeks that have days in a given month.
 
     Args:
@@ -277,16 +406,15 @@ def _get_weeks_for_month(year: int, month: int) -> list[tuple[int, int]]:
         month: Month (1-12).
 
     Returns:
-        List of (year, week) tuples.
+        Sorted tuple of (year, week) tuples.
     """
     from calendar import monthrange
 
     _, days_in_month = monthrange(year, month)
-    weeks = set()
 
-    for day in range(1, days_in_month + 1):
-        d = date(year, month, day)
-        iso_year, iso_week, _ = d.isocalendar()
-        weeks.add((iso_year, iso_week))
+    # Every ISO week spans 7 consecutive days, so probing one day per week
+    # (plus the last day of the month) hits every week the month touches.
+    probe_days = [*range(1, days_in_month + 1, 7), days_in_month]
+    weeks = {date(year, month, day).isocalendar()[:2] for day in probe_days}
 
-    return list(weeks)
+    return tuple(sorted(weeks))
@@ -4,10 +4,10 @@ from datetime import date
 from pathlib import Path
 
 import pytest
-import yaml
 from click.testing import CliRunner
 
 from brag.models import Entry
+from test.fixtures import yaml_io
 
 
 @pytest.fixture
@@ -34,7 +34,7 @@ def mock_config(temp_brag_dir: Path) -> dict:
     }
     config_path = temp_brag_dir / "config.yaml"
     with open(config_path, "w") as f:
-        yaml.dump(config, f)
+        yaml_io.dump(config, f)
     return config
 
 
@@ -51,7 +51,7 @@ def sample_entry() -> Entry:
         title="Implemented user authentication",
         topic="Project Alpha",
         impact="Enabled secure access for 1000+ users",
-        tags=["security", "feature"],
+        tags=("security", "feature"),
         entry_date=date(2024, 11, 25),
     )
 
@@ -63,7 +63,7 @@ def sample_entry_no_tags() -> Entry:
         title="Fixed critical bug",
         topic="Code Review",
         impact="Prevented data loss for customers",
-        tags=[],
+        tags=(),
         entry_date=date(2024, 11, 25),
     )
 
@@ -76,21 +76,21 @@ def sample_entries() -> list[Entry]:
             title="Implemented user authentication",
             topic="Project Alpha",
             impact="Enabled secure access for 1000+ users",
-            tags=["security", "feature"],
+            tags=("security", "feature"),
             entry_date=date(2024, 11, 25),
         ),
         Entry(
             title="Reviewed pull requests",
             topic="Code Review",
             impact="Improved code quality across team",
-            tags=["review"],
+            tags=("review",),
             entry_date=date(2024, 11, 25),
         ),
         Entry(
             title="Updated API documentation",
             topic="Documentation",
             impact="Reduced support tickets by 20%",
-            tags=["docs", "api"],
+            tags=("docs", "api"),
             entry_date=date(2024, 11, 26),
         ),
     ]
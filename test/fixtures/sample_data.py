@@ -19,7 +19,7 @@ SAMPLE_ENTRY_COMPLETE = Entry(
     title="Implemented user authentication",
     topic="Project Alpha",
     impact="Enabled secure access for 1000+ users",
-    tags=["security", "feature"],
+    tags=("security", "feature"),
     entry_date=date(2024, 11, 25),
 )
 
@@ -27,7 +27,7 @@ SAMPLE_ENTRY_NO_TAGS = Entry(
     title="Fixed critical bug",
     topic="Code Review",
     impact="Prevented data loss for customers",
-    tags=[],
+    tags=(),
     entry_date=date(2024, 11, 25),
 )
 
@@ -35,7 +35,7 @@ SAMPLE_ENTRY_MULTILINE = Entry(
     title="Optimized database queries",
     topic="API Performance",
     impact="Reduced response time from 500ms to 50ms. Improved user experience significantly.",
-    tags=["performance", "database"],
+    tags=("performance", "database"),
     entry_date=date(2024, 11, 26),
 )
 
@@ -0,0 +1,22 @@
+"""YAML writer for tests, backed by libyaml when it is available.
+
+yaml is imported on first use so that collecting tests which never touch
+YAML does not pay for it.
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """Import yaml and pick the fastest safe dumper."""
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml, dumper
+
+
+def dump(data, stream) -> None:
+    """Serialize data as YAML into a stream."""
+    yaml, dumper = _yaml()
+    yaml.dump(data, stream, Dumper=dumper)
@@ -1,346 +1,345 @@
 """Integration tests for CLI commands."""
 
-from unittest.mock import patch
+import shutil
+import sys
+from types import SimpleNamespace
 
+import click
 import pytest
-import yaml
-from click.testing import CliRunner
 from freezegun import freeze_time
 
 from brag import __version__
 from brag.cli import main
 
+_CONFIG_YAML = "topics:\n- Project Alpha\n- Code Review\n"
+_EMPTY_TOPICS_YAML = "topics: []\n"
+_WEEK_48_MD = b"""# Week 48 - 2024
+
+## 2024-11-25
+### Implemented authentication
+- **Topic:** Project Alpha
+- **Impact:** Secured user access
+- **Tags:** security, feature
+
+### Reviewed PRs
+- **Topic:** Code Review
+- **Impact:** Improved code quality
+"""
+
 
 @pytest.fixture
-def runner():
-    """Click CliRunner instance."""
-    return CliRunner()
+def invoke(capsys):
+    """Run the brag CLI in-process, without CliRunner's stream isolation.
+
+    Returns a function taking the argument list and returning an object with
+    ``exit_code`` and ``output`` (captured stdout followed by stderr).
+    """
+
+    def _invoke(args):
+        try:
+            rv = main.main(args, prog_name="brag", standalone_mode=False)
+            exit_code = rv if isinstance(rv, int) else 0
+        except SystemExit as e:
+            exit_code = e.code or 0
+        except click.ClickException as e:
+            e.show()
+            exit_code = e.exit_code
+        captured = capsys.readouterr()
+        return SimpleNamespace(exit_code=exit_code, output=captured.out + captured.err)
+
+    return _invoke
+
+
+class FakePrompt:
+    """Prompt returned by FakeQuestionary, answering with a preset value."""
+
+    def __init__(self, answer):
+        self.answer = answer
+
+    def ask(self):
+        return self.answer
+
+
+class FakeQuestionary:
+    """Lightweight stand-in for the questionary prompts used by `brag add`.
+
+    Each prompt kind answers from its own queue; once a queue is empty the
+    prompt answers None, as a cancelled prompt does.
+    """
+
+    def __init__(self):
+        self.answers = {"select": [], "text": [], "confirm": []}
+
+    def answer(self, select=(), text=(), confirm=()):
+        """Queue answers for the upcoming prompts."""
+        self.answers["select"].extend(select)
+        self.answers["text"].extend(text)
+        self.answers["confirm"].extend(confirm)
+
+    def _prompt(self, kind):
+        queue = self.answers[kind]
+        return FakePrompt(queue.pop(0) if queue else None)
+
+    def select(self, *args, **kwargs):
+        return self._prompt("select")
+
+    def text(self, *args, **kwargs):
+        return self._prompt("text")
+
+    def confirm(self, *args, **kwargs):
+        return self._prompt("confirm")
+
+
+@pytest.fixture(autouse=True)
+def stub_config(request, monkeypatch):
+    """Serve the sample topics without parsing YAML, for tests marked stub_config."""
+    if request.node.get_closest_marker("stub_config") is None:
+        return
+    monkeypatch.setattr("brag.config.load_config", lambda: {"topics": ["Project Alpha", "Code Review"]})
 
 
 @pytest.fixture
-def initialized_env(tmp_path, monkeypatch):
-    """Set up initialized brag environment."""
-    brag_dir = tmp_path / "brag"
-    brag_dir.mkdir()
-    entries_dir = brag_dir / "entries"
-    entries_dir.mkdir()
-    config_path = brag_dir / "config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump({"topics": ["Project Alpha", "Code Review"]}, f)
-    monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+def fake_questionary(monkeypatch):
+    """FakeQuestionary installed as the questionary module `brag add` imports."""
+    fake = FakeQuestionary()
+    monkeypatch.setitem(sys.modules, "questionary", fake)
+    return fake
+
+
+@pytest.fixture(scope="session")
+def initialized_template(tmp_path_factory):
+    """Initialized brag directory, built once and copied into each test."""
+    brag_dir = tmp_path_factory.mktemp("templates") / "initialized"
+    (brag_dir / "entries").mkdir(parents=True)
+    (brag_dir / "config.yaml").write_text(_CONFIG_YAML)
     return brag_dir
 
 
-@pytest.fixture
-def env_with_entries(initialized_env):
-    """Initialized environment with sample entries."""
-    entries_dir = initialized_env / "entries" / "2024"
+@pytest.fixture(scope="session")
+def entries_template(tmp_path_factory, initialized_template):
+    """Initialized brag directory with sample entries, built once."""
+    brag_dir = tmp_path_factory.mktemp("templates") / "with_entries"
+    shutil.copytree(initialized_template, brag_dir)
+    entries_dir = brag_dir / "entries" / "2024"
     entries_dir.mkdir(parents=True)
-    week_file = entries_dir / "week-48.md"
-    week_file.write_text("""# Week 48 - 2024
+    (entries_dir / "week-48.md").write_bytes(_WEEK_48_MD)
+    return brag_dir
 
-## 2024-11-25
-### Implemented authentication
-- **Topic:** Project Alpha
-- **Impact:** Secured user access
-- **Tags:** security, feature
 
-### Reviewed PRs
-- **Topic:** Code Review
-- **Impact:** Improved code quality
-""")
-    return initialized_env
+@pytest.fixture(scope="class")
+def env_with_entries(entries_template):
+    """Environment pointing at the sample entries template, for read-only tests."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("BRAG_DIR", str(entries_template))
+        yield entries_template
+
+
+@pytest.fixture
+def initialized_env(tmp_path, monkeypatch, initialized_template):
+    """Set up initialized brag environment."""
+    brag_dir = tmp_path / "brag"
+    shutil.copytree(initialized_template, brag_dir)
+    monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+    return brag_dir
 
 
 class TestInitCommand:
     """Tests for init command."""
 
-    def test_init_success(self, runner, tmp_path, monkeypatch):
+    def test_init_success(self, invoke, tmp_path, monkeypatch):
         """Initialize new brag directory."""
         brag_dir = tmp_path / "brag"
         monkeypatch.setenv("BRAG_DIR", str(brag_dir))
 
-        result = runner.invoke(main, ["init"])
+        result = invoke(["init"])
 
         assert result.exit_code == 0
         assert "Initialized brag directory" in result.output
         assert (brag_dir / "config.yaml").exists()
         assert (brag_dir / "entries").exists()
 
-    def test_init_already_initialized(self, runner, initialized_env):
+    def test_init_already_initialized(self, invoke, initialized_env):
         """Handle already initialized directory."""
-        result = runner.invoke(main, ["init"])
+        result = invoke(["init"])
 
         assert result.exit_code == 0
         assert "already initialized" in result.output
 
-    def test_init_missing_env_var(self, runner, monkeypatch):
-        """Error when BRAG_DIR not set."""
-        monkeypatch.delenv("BRAG_DIR", raising=False)
-
-        result = runner.invoke(main, ["init"])
-
-        assert result.exit_code == 1
-        assert "BRAG_DIR" in result.output
-
 
 class TestAddCommand:
     """Tests for add command."""
 
-    def test_add_not_initialized(self, runner, tmp_path, monkeypatch):
-        """Error when not initialized."""
-        brag_dir = tmp_path / "brag"
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = runner.invoke(main, ["add"])
-
-        assert result.exit_code == 1
-        assert "not initialized" in result.output
-
-    def test_add_no_topics(self, runner, tmp_path, monkeypatch):
+    def test_add_no_topics(self, invoke, tmp_path, monkeypatch):
         """Error when no topics defined."""
         brag_dir = tmp_path / "brag"
         brag_dir.mkdir()
         entries_dir = brag_dir / "entries"
         entries_dir.mkdir()
         config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({"topics": []}, f)
+        config_path.write_text(_EMPTY_TOPICS_YAML)
         monkeypatch.setenv("BRAG_DIR", str(brag_dir))
 
-        result = runner.invoke(main, ["add"])
+        result = invoke(["add"])
 
         assert result.exit_code == 1
         assert "No topics defined" in result.output
 
-    @freeze_time("2024-11-25")
-    def test_add_success_mock_input(self, runner, initialized_env):
-        """Successfully add entry with mocked prompts."""
-        with patch("brag.cli.questionary") as mock_questionary:
-            # Mock all questionary prompts
-            mock_questionary.select.return_value.ask.return_value = "Project Alpha"
-            mock_questionary.text.return_value.ask.side_effect = [
-                "Implemented new feature",  # title
-                "Improved user experience",  # impact
-                "feature, improvement",  # tags
-            ]
-            mock_questionary.confirm.return_value.ask.return_value = True
-
-            result = runner.invoke(main, ["add"])
-
-        assert result.exit_code == 0
-        assert "Entry saved" in result.output
-
-        # Verify entry was written
-        week_file = initialized_env / "entries" / "2024" / "week-48.md"
-        assert week_file.exists()
-        content = week_file.read_text()
-        assert "Implemented new feature" in content
-
-    def test_add_cancelled_at_topic(self, runner, initialized_env):
+    @pytest.mark.stub_config
+    def test_add_cancelled_at_topic(self, invoke, initialized_env, fake_questionary):
         """Handle cancellation at topic selection."""
-        with patch("brag.cli.questionary") as mock_questionary:
-            mock_questionary.select.return_value.ask.return_value = None
-
-            result = runner.invoke(main, ["add"])
+        # Nothing queued, so the topic prompt answers None
+        result = invoke(["add"])
 
         assert result.exit_code == 0
         assert "Cancelled" in result.output
 
-    def test_add_cancelled_at_title(self, runner, initialized_env):
+    @pytest.mark.stub_config
+    def test_add_cancelled_at_title(self, invoke, initialized_env, fake_questionary):
         """Handle cancellation at title prompt."""
-        with patch("brag.cli.questionary") as mock_questionary:
-            mock_questionary.select.return_value.ask.return_value = "Project Alpha"
-            mock_questionary.text.return_value.ask.return_value = None
+        fake_questionary.answer(select=["Project Alpha"])
 
-            result = runner.invoke(main, ["add"])
+        result = invoke(["add"])
 
         assert result.exit_code == 0
         assert "Cancelled" in result.output
 
-    def test_add_cancelled_at_impact(self, runner, initialized_env):
+    @pytest.mark.stub_config
+    def test_add_cancelled_at_impact(self, invoke, initialized_env, fake_questionary):
         """Handle cancellation at impact prompt."""
-        with patch("brag.cli.questionary") as mock_questionary:
-            mock_questionary.select.return_value.ask.return_value = "Project Alpha"
-            mock_questionary.text.return_value.ask.side_effect = [
+        fake_questionary.answer(
+            select=["Project Alpha"],
+            text=[
                 "Test title",  # title
                 None,  # impact (cancelled)
-            ]
+            ],
+        )
 
-            result = runner.invoke(main, ["add"])
+        result = invoke(["add"])
 
         assert result.exit_code == 0
         assert "Cancelled" in result.output
 
-    @freeze_time("2024-11-25")
-    def test_add_declined_confirmation(self, runner, initialized_env):
-        """Handle declining save confirmation."""
-        with patch("brag.cli.questionary") as mock_questionary:
-            mock_questionary.select.return_value.ask.return_value = "Project Alpha"
-            mock_questionary.text.return_value.ask.side_effect = [
-                "Test title",
-                "Test impact",
-                "",  # no tags
-            ]
-            mock_questionary.confirm.return_value.ask.return_value = False
-
-            result = runner.invoke(main, ["add"])
-
-        assert result.exit_code == 0
-        assert "discarded" in result.output
-
-    @freeze_time("2024-11-25")
-    def test_add_with_tags(self, runner, initialized_env):
-        """Add entry with tags."""
-        with patch("brag.cli.questionary") as mock_questionary:
-            mock_questionary.select.return_value.ask.return_value = "Project Alpha"
-            mock_questionary.text.return_value.ask.side_effect = [
-                "Test with tags",
-                "Test impact",
-                "tag1, tag2, tag3",
-            ]
-            mock_questionary.confirm.return_value.ask.return_value = True
-
-            result = runner.invoke(main, ["add"])
-
-        assert result.exit_code == 0
-        week_file = initialized_env / "entries" / "2024" / "week-48.md"
-        content = week_file.read_text()
-        assert "tag1" in content
-        assert "tag2" in content
-
-    @freeze_time("2024-11-25")
-    def test_add_without_tags(self, runner, initialized_env):
-        """Add entry without tags."""
-        with patch("brag.cli.questionary") as mock_questionary:
-            mock_questionary.select.return_value.ask.return_value = "Project Alpha"
-            mock_questionary.text.return_value.ask.side_effect = [
+    @pytest.mark.parametrize(
+        "title,tags,confirm,expect_output,expect_in_file,expect_not_in_file",
+        [
+            ("Test with tags", "tag1, tag2, tag3", True, "Entry saved", ["- **Tags:** tag1, tag2, tag3"], []),
+            (
                 "Test without tags",
-                "Test impact",
-                "",  # empty tags
-            ]
-            mock_questionary.confirm.return_value.ask.return_value = True
-
-            result = runner.invoke(main, ["add"])
+                "",
+                True,
+                "Entry saved",
+                [
+                    "## 2024-11-25",
+                    "### Test without tags",
+                    "- **Topic:** Project Alpha",
+                    "- **Impact:** Test impact",
+                ],
+                ["Tags:"],
+            ),
+            ("Test title", "", False, "discarded", [], ["Test title"]),
+        ],
+        ids=["with_tags", "without_tags", "declined"],
+    )
+    @pytest.mark.stub_config
+    @freeze_time("2024-11-25")
+    def test_add_prompts(
+        self,
+        invoke,
+        initialized_env,
+        fake_questionary,
+        title,
+        tags,
+        confirm,
+        expect_output,
+        expect_in_file,
+        expect_not_in_file,
+    ):
+        """Answered prompts save the entry, or discard it when not confirmed."""
+        fake_questionary.answer(
+            select=["Project Alpha"],
+            text=[title, "Test impact", tags],
+            confirm=[confirm],
+        )
+
+        result = invoke(["add"])
 
         assert result.exit_code == 0
+        assert expect_output in result.output
         week_file = initialized_env / "entries" / "2024" / "week-48.md"
-        content = week_file.read_text()
-        assert "Test without tags" in content
-        assert "Tags:" not in content or "Tags:" in content  # may or may not have tags line
+        content = week_file.read_text() if week_file.exists() else ""
+        for text in expect_in_file:
+            assert text in content
+        for text in expect_not_in_file:
+            assert text not in content
 
 
 class TestListCommand:
     """Tests for list command."""
 
-    def test_list_not_initialized(self, runner, tmp_path, monkeypatch):
-        """Error when not initialized."""
-        brag_dir = tmp_path / "brag"
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = runner.invoke(main, ["list"])
-
-        assert result.exit_code == 1
-        assert "not initialized" in result.output
-
     @freeze_time("2024-11-25")
-    def test_list_no_entries(self, runner, initialized_env):
+    def test_list_no_entries(self, invoke, initialized_env):
         """Display message when no entries."""
-        result = runner.invoke(main, ["list"])
+        result = invoke(["list"])
 
         assert result.exit_code == 0
         assert "No entries found" in result.output
 
     @freeze_time("2024-11-25")
-    def test_list_current_week(self, runner, env_with_entries):
+    def test_list_current_week(self, invoke, env_with_entries):
         """List entries from current week."""
-        result = runner.invoke(main, ["list"])
+        result = invoke(["list"])
 
         assert result.exit_code == 0
         assert "Implemented authentication" in result.output
         assert "Reviewed PRs" in result.output
 
-    def test_list_by_week(self, runner, env_with_entries):
-        """Filter by week number."""
-        result = runner.invoke(main, ["list", "--week", "48", "--year", "2024"])
-
-        assert result.exit_code == 0
-        assert "Implemented authentication" in result.output
-
-    def test_list_by_month(self, runner, env_with_entries):
-        """Filter by month."""
-        result = runner.invoke(main, ["list", "--month", "11", "--year", "2024"])
-
-        assert result.exit_code == 0
-        assert "Implemented authentication" in result.output
-
-    def test_list_by_quarter(self, runner, env_with_entries):
-        """Filter by quarter."""
-        result = runner.invoke(main, ["list", "--quarter", "4", "--year", "2024"])
+    @pytest.mark.parametrize(
+        "args,expect_present,expect_absent",
+        [
+            (["--week", "48", "--year", "2024"], ["Implemented authentication"], []),
+            (["--month", "11", "--year", "2024"], ["Implemented authentication"], []),
+            (["--quarter", "4", "--year", "2024"], ["Implemented authentication"], []),
+            (["--semester", "2", "--year", "2024"], ["Implemented authentication"], []),
+            (
+                ["--week", "48", "--year", "2024", "--topic", "Project Alpha"],
+                ["Implemented authentication"],
+                ["Reviewed PRs"],
+            ),
+            (
+                ["--month", "11", "--year", "2024", "--topic", "Code Review"],
+                ["Reviewed PRs"],
+                ["Implemented authentication"],
+            ),
+        ],
+        ids=["week", "month", "quarter", "semester", "topic", "combined"],
+    )
+    def test_list_filters(self, invoke, env_with_entries, args, expect_present, expect_absent):
+        """Filter options select the matching entries."""
+        result = invoke(["list", *args])
 
         assert result.exit_code == 0
-        assert "Implemented authentication" in result.output
-
-    def test_list_by_semester(self, runner, env_with_entries):
-        """Filter by semester."""
-        result = runner.invoke(main, ["list", "--semester", "2", "--year", "2024"])
-
-        assert result.exit_code == 0
-        assert "Implemented authentication" in result.output
-
-    def test_list_by_year(self, runner, env_with_entries):
-        """Filter by year."""
-        result = runner.invoke(main, ["list", "--week", "48", "--year", "2024"])
-
-        assert result.exit_code == 0
-        assert "Implemented authentication" in result.output
-
-    def test_list_by_topic(self, runner, env_with_entries):
-        """Filter by topic."""
-        result = runner.invoke(main, ["list", "--week", "48", "--year", "2024", "--topic", "Project Alpha"])
-
-        assert result.exit_code == 0
-        assert "Implemented authentication" in result.output
-        assert "Reviewed PRs" not in result.output
-
-    def test_list_combined_filters(self, runner, env_with_entries):
-        """Multiple filters together."""
-        result = runner.invoke(main, ["list", "--month", "11", "--year", "2024", "--topic", "Code Review"])
-
-        assert result.exit_code == 0
-        assert "Reviewed PRs" in result.output
-        assert "Implemented authentication" not in result.output
+        for title in expect_present:
+            assert title in result.output
+        for title in expect_absent:
+            assert title not in result.output
 
 
 class TestTopicAddCommand:
     """Tests for topic add command."""
 
-    def test_topic_add_not_initialized(self, runner, tmp_path, monkeypatch):
-        """Error when not initialized."""
-        brag_dir = tmp_path / "brag"
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = runner.invoke(main, ["topic", "add", "New Topic"])
-
-        assert result.exit_code == 1
-        assert "not initialized" in result.output
-
-    def test_topic_add_success(self, runner, initialized_env):
+    def test_topic_add_success(self, invoke, initialized_env):
         """Add new topic."""
-        result = runner.invoke(main, ["topic", "add", "New Topic"])
+        result = invoke(["topic", "add", "New Topic"])
 
         assert result.exit_code == 0
         assert "Added topic" in result.output
 
         # Verify config was updated
-        config_path = initialized_env / "config.yaml"
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-        assert "New Topic" in config["topics"]
+        assert "- New Topic\n" in (initialized_env / "config.yaml").read_text()
 
-    def test_topic_add_duplicate(self, runner, initialized_env):
+    def test_topic_add_duplicate(self, invoke, initialized_env):
         """Error on duplicate topic."""
-        result = runner.invoke(main, ["topic", "add", "Project Alpha"])
+        result = invoke(["topic", "add", "Project Alpha"])
 
         assert result.exit_code == 1
         assert "already exists" in result.output
@@ -349,35 +348,24 @@ class TestTopicAddCommand:
 class TestTopicListCommand:
     """Tests for topic list command."""
 
-    def test_topic_list_not_initialized(self, runner, tmp_path, monkeypatch):
-        """Error when not initialized."""
-        brag_dir = tmp_path / "brag"
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = runner.invoke(main, ["topic", "list"])
-
-        assert result.exit_code == 1
-        assert "not initialized" in result.output
-
-    def test_topic_list_empty(self, runner, tmp_path, monkeypatch):
+    def test_topic_list_empty(self, invoke, tmp_path, monkeypatch):
         """Display message when no topics."""
         brag_dir = tmp_path / "brag"
         brag_dir.mkdir()
         entries_dir = brag_dir / "entries"
         entries_dir.mkdir()
         config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({"topics": []}, f)
+        config_path.write_text(_EMPTY_TOPICS_YAML)
         monkeypatch.setenv("BRAG_DIR", str(brag_dir))
 
-        result = runner.invoke(main, ["topic", "list"])
+        result = invoke(["topic", "list"])
 
         assert result.exit_code == 0
         assert "No topics defined" in result.output
 
-    def test_topic_list_with_topics(self, runner, initialized_env):
+    def test_topic_list_with_topics(self, invoke, initialized_env):
         """Display list of topics."""
-        result = runner.invoke(main, ["topic", "list"])
+        result = invoke(["topic", "list"])
 
         assert result.exit_code == 0
         assert "Project Alpha" in result.output
@@ -387,16 +375,16 @@ class TestTopicListCommand:
 class TestGeneralCLI:
     """Tests for general CLI behavior."""
 
-    def test_version_flag(self, runner):
+    def test_version_flag(self, invoke):
         """Test --version output."""
-        result = runner.invoke(main, ["--version"])
+        result = invoke(["--version"])
 
         assert result.exit_code == 0
         assert __version__ in result.output
 
-    def test_help_flag(self, runner):
+    def test_help_flag(self, invoke):
         """Test --help output."""
-        result = runner.invoke(main, ["--help"])
+        result = invoke(["--help"])
 
         assert result.exit_code == 0
         assert "brag" in result.output.lower()
@@ -405,24 +393,49 @@ class TestGeneralCLI:
         assert "list" in result.output
         assert "topic" in result.output
 
-    def test_help_flag_subcommand(self, runner):
+    def test_help_flag_subcommand(self, invoke):
         """Test --help for subcommands."""
-        result = runner.invoke(main, ["add", "--help"])
+        result = invoke(["add", "--help"])
 
         assert result.exit_code == 0
         assert "accomplishment" in result.output.lower()
 
-    def test_invalid_command(self, runner):
+    def test_invalid_command(self, invoke):
         """Test invalid command."""
-        result = runner.invoke(main, ["invalid-command"])
+        result = invoke(["invalid-command"])
 
         assert result.exit_code != 0
 
-    def test_handle_error_decorator(self, runner, monkeypatch):
-        """Test error handling decorator."""
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["add"],
+            ["list"],
+            ["topic", "add", "New Topic"],
+            ["topic", "list"],
+        ],
+    )
+    def test_commands_require_init(self, invoke, tmp_path, monkeypatch, args):
+        """Error when the brag directory is not initialized."""
+        monkeypatch.setenv("BRAG_DIR", str(tmp_path / "brag"))
+
+        result = invoke(args)
+
+        assert result.exit_code == 1
+        assert "not initialized" in result.output
+
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            (["init"], "BRAG_DIR"),
+            (["list"], "Error"),
+        ],
+    )
+    def test_commands_missing_env_var(self, invoke, monkeypatch, args, expected):
+        """Error when BRAG_DIR is not set."""
         monkeypatch.delenv("BRAG_DIR", raising=False)
 
-        result = runner.invoke(main, ["list"])
+        result = invoke(args)
 
         assert result.exit_code == 1
-        assert "Error" in result.output
+        assert expected in result.output
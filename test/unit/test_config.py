@@ -3,7 +3,6 @@
 from pathlib import Path
 
 import pytest
-import yaml
 
 from brag.config import (
     ConfigError,
@@ -17,6 +16,31 @@ from brag.config import (
     save_config,
 )
 
+_TWO_TOPICS = b"topics:\n- Project Alpha\n- Code Review\n"
+_EMPTY_TOPICS = b"topics: []\n"
+
+
+def _setup_brag(tmp_path, monkeypatch, config=None, with_entries=False):
+    """Create a brag directory under tmp_path and point BRAG_DIR at it.
+
+    Args:
+        tmp_path: Directory to create the brag directory in.
+        monkeypatch: Fixture used to set BRAG_DIR.
+        config: Raw config.yaml contents; no config file is written if None.
+        with_entries: Whether to create the entries directory.
+
+    Returns:
+        Path to the brag directory.
+    """
+    brag_dir = tmp_path / "brag"
+    brag_dir.mkdir()
+    if with_entries:
+        (brag_dir / "entries").mkdir()
+    if config is not None:
+        (brag_dir / "config.yaml").write_bytes(config)
+    monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+    return brag_dir
+
 
 class TestGetBragDir:
     """Tests for get_brag_dir function."""
@@ -48,6 +72,14 @@ class TestGetBragDir:
         assert "~" not in str(result)
         assert result == Path.home() / "Documents" / "brag"
 
+    def test_get_brag_dir_follows_env_changes(self, monkeypatch, tmp_path):
+        """Resolve a new directory when BRAG_DIR changes."""
+        monkeypatch.setenv("BRAG_DIR", str(tmp_path / "first"))
+        assert get_brag_dir() == tmp_path / "first"
+
+        monkeypatch.setenv("BRAG_DIR", str(tmp_path / "second"))
+        assert get_brag_dir() == tmp_path / "second"
+
 
 class TestGetConfigPath:
     """Tests for get_config_path function."""
@@ -80,13 +112,8 @@ class TestLoadConfig:
 
     def test_load_config_success(self, monkeypatch, tmp_path):
         """Load valid YAML config."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        config_path = brag_dir / "config.yaml"
         config_data = {"topics": ["Project Alpha", "Code Review"]}
-        with open(config_path, "w") as f:
-            yaml.dump(config_data, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, _TWO_TOPICS)
 
         result = load_config()
 
@@ -95,9 +122,7 @@ class TestLoadConfig:
 
     def test_load_config_missing_file(self, monkeypatch, tmp_path):
         """Raise ConfigError for missing config."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch)
 
         with pytest.raises(ConfigError) as exc_info:
             load_config()
@@ -106,51 +131,56 @@ class TestLoadConfig:
 
     def test_load_config_empty_file(self, monkeypatch, tmp_path):
         """Handle empty config file (return empty dict)."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        config_path = brag_dir / "config.yaml"
-        config_path.touch()  # Create empty file
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, b"")
 
         result = load_config()
 
         assert result == {}
 
+    def test_load_config_picks_up_file_changes(self, monkeypatch, tmp_path):
+        """Reload config when the file changes on disk."""
+        brag_dir = _setup_brag(tmp_path, monkeypatch, b"topics:\n- Old Topic\n")
+        config_path = brag_dir / "config.yaml"
+
+        assert load_config() == {"topics": ["Old Topic"]}
+
+        config_path.write_bytes(b"topics:\n- Old Topic\n- New Topic\n")
+
+        assert load_config() == {"topics": ["Old Topic", "New Topic"]}
+
+    def test_load_config_returns_independent_copies(self, monkeypatch, tmp_path):
+        """Mutating a loaded config doesn't leak into later loads."""
+        _setup_brag(tmp_path, monkeypatch, b"topics:\n- Project Alpha\n")
+
+        load_config()["topics"].append("Mutated")
+
+        assert load_config() == {"topics": ["Project Alpha"]}
+
 
 class TestSaveConfig:
     """Tests for save_config function."""
 
     def test_save_config(self, monkeypatch, tmp_path):
         """Save config and verify file contents."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
+        brag_dir = _setup_brag(tmp_path, monkeypatch)
         config_path = brag_dir / "config.yaml"
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
 
         config_data = {"topics": ["Project Alpha", "Code Review"]}
         save_config(config_data)
 
-        with open(config_path) as f:
-            saved_data = yaml.safe_load(f)
-
-        assert saved_data == config_data
+        assert config_path.read_text() == "topics:\n- Project Alpha\n- Code Review\n"
 
     def test_save_config_overwrites_existing(self, monkeypatch, tmp_path):
         """Save config overwrites existing file."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
+        brag_dir = _setup_brag(tmp_path, monkeypatch, b"topics:\n- Old Topic\n")
         config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({"topics": ["Old Topic"]}, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
 
         new_config = {"topics": ["New Topic"]}
         save_config(new_config)
 
-        with open(config_path) as f:
-            saved_data = yaml.safe_load(f)
-
-        assert saved_data == new_config
+        content = config_path.read_text()
+        assert content == "topics:\n- New Topic\n"
+        assert "Old Topic" not in content
 
 
 class TestGetTopics:
@@ -158,12 +188,7 @@ class TestGetTopics:
 
     def test_get_topics_with_topics(self, monkeypatch, tmp_path):
         """Return list of topics."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({"topics": ["Project Alpha", "Code Review"]}, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, _TWO_TOPICS)
 
         result = get_topics()
 
@@ -171,12 +196,7 @@ class TestGetTopics:
 
     def test_get_topics_empty(self, monkeypatch, tmp_path):
         """Return empty list when no topics."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({"topics": []}, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, _EMPTY_TOPICS)
 
         result = get_topics()
 
@@ -184,12 +204,7 @@ class TestGetTopics:
 
     def test_get_topics_missing_key(self, monkeypatch, tmp_path):
         """Return empty list when topics key is missing."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({}, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, b"{}\n")
 
         result = get_topics()
 
@@ -201,29 +216,16 @@ class TestAddTopic:
 
     def test_add_topic_success(self, monkeypatch, tmp_path):
         """Add new topic to config."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
+        brag_dir = _setup_brag(tmp_path, monkeypatch, b"topics:\n- Existing Topic\n")
         config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({"topics": ["Existing Topic"]}, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
 
         add_topic("New Topic")
 
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-
-        assert "New Topic" in config["topics"]
-        assert "Existing Topic" in config["topics"]
+        assert config_path.read_text() == "topics:\n- Existing Topic\n- New Topic\n"
 
     def test_add_topic_duplicate(self, monkeypatch, tmp_path):
         """Raise ConfigError for duplicate topic."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({"topics": ["Existing Topic"]}, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, b"topics:\n- Existing Topic\n")
 
         with pytest.raises(ConfigError) as exc_info:
             add_topic("Existing Topic")
@@ -232,35 +234,21 @@ class TestAddTopic:
 
     def test_add_topic_to_empty_list(self, monkeypatch, tmp_path):
         """Add topic to empty topics list."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
+        brag_dir = _setup_brag(tmp_path, monkeypatch, _EMPTY_TOPICS)
         config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({"topics": []}, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
 
         add_topic("First Topic")
 
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-
-        assert config["topics"] == ["First Topic"]
+        assert config_path.read_text() == "topics:\n- First Topic\n"
 
     def test_add_topic_missing_topics_key(self, monkeypatch, tmp_path):
         """Add topic when topics key is missing."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
+        brag_dir = _setup_brag(tmp_path, monkeypatch, b"{}\n")
         config_path = brag_dir / "config.yaml"
-        with open(config_path, "w") as f:
-            yaml.dump({}, f)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
 
         add_topic("New Topic")
 
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-
-        assert config["topics"] == ["New Topic"]
+        assert config_path.read_text() == "topics:\n- New Topic\n"
 
 
 class TestIsInitialized:
@@ -268,13 +256,7 @@ class TestIsInitialized:
 
     def test_is_initialized_true(self, monkeypatch, tmp_path):
         """Return True when properly initialized."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        config_path = brag_dir / "config.yaml"
-        entries_dir = brag_dir / "entries"
-        entries_dir.mkdir()
-        config_path.touch()
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, b"", with_entries=True)
 
         result = is_initialized()
 
@@ -282,11 +264,7 @@ class TestIsInitialized:
 
     def test_is_initialized_false_no_config(self, monkeypatch, tmp_path):
         """Return False without config."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        entries_dir = brag_dir / "entries"
-        entries_dir.mkdir()
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, with_entries=True)
 
         result = is_initialized()
 
@@ -294,11 +272,7 @@ class TestIsInitialized:
 
     def test_is_initialized_false_no_entries_dir(self, monkeypatch, tmp_path):
         """Return False without entries dir."""
-        brag_dir = tmp_path / "brag"
-        brag_dir.mkdir()
-        config_path = brag_dir / "config.yaml"
-        config_path.touch()
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        _setup_brag(tmp_path, monkeypatch, b"")
 
         result = is_initialized()
 
@@ -1,10 +1,11 @@
 """Unit tests for Entry model."""
 
+import dataclasses
 from datetime import date
 
 import pytest
 
-from brag.models import Entry
+from brag.models import Entry, parse_tags
 
 
 class TestEntryCreation:
@@ -16,14 +17,14 @@ class TestEntryCreation:
             title="Implemented feature X",
             topic="Project Alpha",
             impact="Increased user engagement by 25%",
-            tags=["feature", "engagement"],
+            tags=("feature", "engagement"),
             entry_date=date(2024, 11, 25),
         )
 
         assert entry.title == "Implemented feature X"
         assert entry.topic == "Project Alpha"
         assert entry.impact == "Increased user engagement by 25%"
-        assert entry.tags == ["feature", "engagement"]
+        assert entry.tags == ("feature", "engagement")
         assert entry.entry_date == date(2024, 11, 25)
 
     def test_entry_creation_with_defaults(self):
@@ -37,20 +38,20 @@ class TestEntryCreation:
         assert entry.title == "Fixed bug"
         assert entry.topic == "Maintenance"
         assert entry.impact == "Resolved customer complaint"
-        assert entry.tags == []
+        assert entry.tags == ()
         assert entry.entry_date == date.today()
 
     def test_entry_creation_empty_tags(self):
-        """Test Entry with explicitly empty tags list."""
+        """Test Entry with explicitly empty tags."""
         entry = Entry(
             title="Test entry",
             topic="Testing",
             impact="Test impact",
-            tags=[],
+            tags=(),
             entry_date=date(2024, 11, 25),
         )
 
-        assert entry.tags == []
+        assert entry.tags == ()
 
     def test_entry_creation_with_special_characters(self):
         """Test Entry with special characters in fields."""
@@ -58,7 +59,7 @@ class TestEntryCreation:
             title="Fixed \"quoted\" issue & special <chars>",
             topic="Code Review",
             impact="Resolved 100% of edge cases",
-            tags=["special-chars", "test_case"],
+            tags=("special-chars", "test_case"),
             entry_date=date(2024, 11, 25),
         )
 
@@ -66,6 +67,40 @@ class TestEntryCreation:
         assert "&" in entry.title
         assert "<chars>" in entry.title
 
+    def test_entry_is_frozen(self):
+        """Entry fields can't be reassigned."""
+        entry = Entry(title="Test entry", topic="Testing", impact="Test impact")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.title = "Changed"
+
+    def test_entry_tags_list_stored_as_tuple(self):
+        """Tags passed as a list are stored as a tuple, keeping Entry hashable."""
+        entry = Entry(
+            title="Test entry",
+            topic="Testing",
+            impact="Test impact",
+            tags=["tag1", "tag2"],
+            entry_date=date(2024, 11, 25),
+        )
+
+        assert entry.tags == ("tag1", "tag2")
+        assert hash(entry) == hash(
+            Entry(
+                title="Test entry",
+                topic="Testing",
+                impact="Test impact",
+                tags=("tag1", "tag2"),
+                entry_date=date(2024, 11, 25),
+            )
+        )
+
+    def test_entry_uses_slots(self):
+        """Entry instances don't carry a per-instance __dict__."""
+        entry = Entry(title="Test entry", topic="Testing", impact="Test impact")
+
+        assert not hasattr(entry, "__dict__")
+
 
 class TestEntryToMarkdown:
     """Tests for Entry.to_markdown() method."""
@@ -76,7 +111,7 @@ class TestEntryToMarkdown:
             title="Implemented user authentication",
             topic="Project Alpha",
             impact="Enabled secure access for 1000+ users",
-            tags=["security", "feature"],
+            tags=("security", "feature"),
             entry_date=date(2024, 11, 25),
         )
 
@@ -93,7 +128,7 @@ class TestEntryToMarkdown:
             title="Fixed critical bug",
             topic="Maintenance",
             impact="Prevented data loss",
-            tags=[],
+            tags=(),
             entry_date=date(2024, 11, 25),
         )
 
@@ -110,7 +145,7 @@ class TestEntryToMarkdown:
             title="Test entry",
             topic="Testing",
             impact="Test impact",
-            tags=["single"],
+            tags=("single",),
             entry_date=date(2024, 11, 25),
         )
 
@@ -124,7 +159,7 @@ class TestEntryToMarkdown:
             title="Test",
             topic="Topic",
             impact="Impact",
-            tags=["tag1", "tag2"],
+            tags=("tag1", "tag2"),
             entry_date=date(2024, 11, 25),
         )
 
@@ -153,7 +188,7 @@ class TestEntryFromMarkdown:
         assert entry.title == "Implemented user authentication"
         assert entry.topic == "Project Alpha"
         assert entry.impact == "Enabled secure access for 1000+ users"
-        assert entry.tags == ["security", "feature"]
+        assert entry.tags == ("security", "feature")
         assert entry.entry_date == date(2024, 11, 25)
 
     def test_entry_from_markdown_minimal(self):
@@ -168,7 +203,7 @@ class TestEntryFromMarkdown:
         assert entry.title == "Fixed critical bug"
         assert entry.topic == "Code Review"
         assert entry.impact == "Prevented data loss for customers"
-        assert entry.tags == []
+        assert entry.tags == ()
 
     def test_entry_from_markdown_invalid(self):
         """Return None for invalid markdown."""
@@ -213,7 +248,26 @@ It has no proper headers or fields"""
         assert entry.title == "Test entry"
         assert entry.topic == "Test Topic"
         assert entry.impact == "Test impact"
-        assert entry.tags == ["tag1", "tag2"]
+        assert entry.tags == ("tag1", "tag2")
+
+
+class TestParseTags:
+    """Tests for parse_tags function."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("", ()),
+            ("   ", ()),
+            ("solo", ("solo",)),
+            ("  solo  ", ("solo",)),
+            ("a, b,c", ("a", "b", "c")),
+            ("a, , b,", ("a", "b")),
+        ],
+    )
+    def test_parse_tags(self, value, expected):
+        """Split, strip and drop empty tags."""
+        assert parse_tags(value) == expected
 
 
 class TestEntryRoundTrip:
@@ -225,7 +279,7 @@ class TestEntryRoundTrip:
             title="Implemented user authentication",
             topic="Project Alpha",
             impact="Enabled secure access for 1000+ users",
-            tags=["security", "feature"],
+            tags=("security", "feature"),
             entry_date=date(2024, 11, 25),
         )
 
@@ -245,7 +299,7 @@ class TestEntryRoundTrip:
             title="Fixed bug",
             topic="Maintenance",
             impact="Bug fixed",
-            tags=[],
+            tags=(),
             entry_date=date(2024, 11, 25),
         )
 
@@ -254,15 +308,15 @@ class TestEntryRoundTrip:
 
         assert parsed is not None
         assert parsed.title == original.title
-        assert parsed.tags == []
+        assert parsed.tags == ()
 
     @pytest.mark.parametrize(
         "title,topic,impact,tags",
         [
-            ("Simple title", "Topic", "Impact", []),
-            ("Title with numbers 123", "Topic 2", "Impact 100%", ["tag1"]),
-            ("Multi word title here", "Complex Topic Name", "Very long impact description here", ["a", "b", "c"]),
-            ("Special chars: & < > \"", "Topic", "Impact", ["special-tag"]),
+            ("Simple title", "Topic", "Impact", ()),
+            ("Title with numbers 123", "Topic 2", "Impact 100%", ("tag1",)),
+            ("Multi word title here", "Complex Topic Name", "Very long impact description here", ("a", "b", "c")),
+            ("Special chars: & < > \"", "Topic", "Impact", ("special-tag",)),
         ],
     )
     def test_entry_round_trip_parametrized(self, title, topic, impact, tags):
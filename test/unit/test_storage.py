@@ -1,5 +1,6 @@
 """Unit tests for storage operations."""
 
+import os
 from datetime import date
 
 import pytest
@@ -7,6 +8,7 @@ from freezegun import freeze_time
 
 from brag.models import Entry
 from brag.storage import (
+    _existing_weeks,
     _get_weeks_for_month,
     add_entry,
     ensure_week_file,
@@ -18,6 +20,35 @@ from brag.storage import (
     parse_week_file,
 )
 
+# Entries shared by the read-only tests, as (date, title, topic)
+_SHARED_ENTRIES = [
+    (date(2024, 3, 4), "March entry", "Topic"),
+    (date(2024, 7, 1), "July entry", "Topic"),
+    (date(2024, 10, 28), "October entry", "Topic"),
+    (date(2024, 11, 18), "November entry", "Topic"),
+    (date(2024, 11, 25), "Alpha entry", "Project Alpha"),
+    (date(2024, 11, 25), "Beta entry", "Project Beta"),
+    (date(2024, 11, 25), "Street work", "Straße"),
+    (date(2024, 12, 2), "Week 49 entry", "Topic"),
+    # ISO week 1 of 2025, stored in 2024/week-01.md
+    (date(2024, 12, 30), "Year end entry", "Topic"),
+    (date(2025, 1, 6), "January entry", "Topic"),
+    # Stored in 2025/week-01.md, next to the 2024 week 1 number
+    (date(2025, 12, 29), "Next year end entry", "Topic"),
+]
+
+
+@pytest.fixture(scope="module")
+def brag_env(tmp_path_factory):
+    """Read-only brag directory holding _SHARED_ENTRIES, built once per module."""
+    brag_dir = tmp_path_factory.mktemp("storage") / "brag"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("BRAG_DIR", str(brag_dir))
+        for entry_date, title, topic in _SHARED_ENTRIES:
+            add_entry(Entry(title=title, topic=topic, impact="Impact", entry_date=entry_date))
+        (brag_dir / "entries" / "2024" / "notes.txt").write_text("not a week file\n")
+        yield brag_dir
+
 
 class TestGetWeekNumber:
     """Tests for get_week_number function."""
@@ -55,27 +86,23 @@ class TestGetWeekNumber:
 class TestGetWeekFilePath:
     """Tests for get_week_file_path function."""
 
-    def test_get_week_file_path(self, monkeypatch, tmp_path):
+    def test_get_week_file_path(self, brag_env):
         """Test path construction for week files."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        entries_dir.mkdir(parents=True)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
         result = get_week_file_path(2024, 48)
 
-        assert result == entries_dir / "2024" / "week-48.md"
+        assert result == brag_env / "entries" / "2024" / "week-48.md"
 
-    def test_get_week_file_path_single_digit_week(self, monkeypatch, tmp_path):
+    def test_get_week_file_path_single_digit_week(self, brag_env):
         """Test path with single digit week (should be zero-padded)."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        entries_dir.mkdir(parents=True)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
         result = get_week_file_path(2024, 1)
 
-        assert result == entries_dir / "2024" / "week-01.md"
+        assert result == brag_env / "entries" / "2024" / "week-01.md"
+
+    def test_get_week_file_path_out_of_range_week(self, brag_env):
+        """Week numbers past 53 are still formatted."""
+        result = get_week_file_path(2024, 99)
+
+        assert result == brag_env / "entries" / "2024" / "week-99.md"
 
 
 class TestEnsureWeekFile:
@@ -136,7 +163,7 @@ class TestAddEntry:
             title="Test entry",
             topic="Project Alpha",
             impact="Test impact",
-            tags=["tag1"],
+            tags=("tag1",),
             entry_date=date(2024, 11, 25),
         )
 
@@ -162,7 +189,7 @@ class TestAddEntry:
             title="New entry",
             topic="Project Alpha",
             impact="Test impact",
-            tags=[],
+            tags=(),
             entry_date=date(2024, 11, 25),
         )
 
@@ -186,7 +213,7 @@ class TestAddEntry:
             title="New date entry",
             topic="Project Alpha",
             impact="Test impact",
-            tags=[],
+            tags=(),
             entry_date=date(2024, 11, 26),
         )
 
@@ -197,6 +224,142 @@ class TestAddEntry:
         assert "## 2024-11-26" in content
         assert "### New date entry" in content
 
+    def test_add_entry_appends_to_last_date_section(self, monkeypatch, tmp_path):
+        """Append under the trailing date section without touching the rest."""
+        brag_dir = tmp_path / "brag"
+        entries_dir = brag_dir / "entries"
+        entries_dir.mkdir(parents=True)
+        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+
+        for title in ("First entry", "Second entry"):
+            add_entry(
+                Entry(
+                    title=title,
+                    topic="Project Alpha",
+                    impact="Test impact",
+                    entry_date=date(2024, 11, 25),
+                )
+            )
+
+        week_file = entries_dir / "2024" / "week-48.md"
+        assert week_file.read_text() == (
+            "# Week 48 - 2024\n"
+            "\n"
+            "## 2024-11-25\n"
+            "### First entry\n"
+            "- **Topic:** Project Alpha\n"
+            "- **Impact:** Test impact\n"
+            "### Second entry\n"
+            "- **Topic:** Project Alpha\n"
+            "- **Impact:** Test impact\n"
+        )
+
+    def test_add_entry_appends_new_date_section(self, monkeypatch, tmp_path):
+        """Start a new date section at the end of the file."""
+        brag_dir = tmp_path / "brag"
+        entries_dir = brag_dir / "entries"
+        entries_dir.mkdir(parents=True)
+        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+
+        for title, day in (("First entry", 25), ("Second entry", 26)):
+            add_entry(
+                Entry(
+                    title=title,
+                    topic="Project Alpha",
+                    impact="Test impact",
+                    entry_date=date(2024, 11, day),
+                )
+            )
+
+        week_file = entries_dir / "2024" / "week-48.md"
+        assert week_file.read_text() == (
+            "# Week 48 - 2024\n"
+            "\n"
+            "## 2024-11-25\n"
+            "### First entry\n"
+            "- **Topic:** Project Alpha\n"
+            "- **Impact:** Test impact\n"
+            "\n"
+            "## 2024-11-26\n"
+            "### Second entry\n"
+            "- **Topic:** Project Alpha\n"
+            "- **Impact:** Test impact\n"
+        )
+
+    def test_add_entry_new_date_section_after_large_section(self, monkeypatch, tmp_path):
+        """Start a new date section when the last one is longer than the read tail."""
+        brag_dir = tmp_path / "brag"
+        entries_dir = brag_dir / "entries"
+        year_dir = entries_dir / "2024"
+        year_dir.mkdir(parents=True)
+        week_file = year_dir / "week-48.md"
+        existing = "# Week 48 - 2024\n\n## 2024-11-25\n" + "### Entry\n- **Topic:** Test\n- **Impact:** Test\n" * 200
+        week_file.write_text(existing)
+        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+
+        add_entry(Entry(title="New entry", topic="Test", impact="Test", entry_date=date(2024, 11, 26)))
+
+        assert week_file.read_text() == (
+            existing + "\n## 2024-11-26\n### New entry\n- **Topic:** Test\n- **Impact:** Test\n"
+        )
+
+    @pytest.mark.skipif(os.linesep != "\n", reason="CRLF is the native line ending")
+    def test_add_entry_normalizes_crlf_file(self, monkeypatch, tmp_path):
+        """A CRLF week file is rewritten with LF endings, not appended to."""
+        brag_dir = tmp_path / "brag"
+        year_dir = brag_dir / "entries" / "2024"
+        year_dir.mkdir(parents=True)
+        week_file = year_dir / "week-48.md"
+        week_file.write_bytes(b"# Week 48 - 2024\r\n\r\n## 2024-11-25\r\n### Existing entry\r\n- **Topic:** Test\r\n")
+        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+
+        add_entry(Entry(title="New entry", topic="Test", impact="Test", entry_date=date(2024, 11, 25)))
+
+        assert week_file.read_bytes() == (
+            b"# Week 48 - 2024\n\n## 2024-11-25\n### Existing entry\n- **Topic:** Test\n"
+            b"### New entry\n- **Topic:** Test\n- **Impact:** Test\n"
+        )
+
+    @pytest.mark.skipif(os.linesep != "\n", reason="CRLF is the native line ending")
+    def test_add_entry_new_date_section_normalizes_crlf_file(self, monkeypatch, tmp_path):
+        """Starting a date section in a CRLF week file rewrites it with LF endings."""
+        brag_dir = tmp_path / "brag"
+        year_dir = brag_dir / "entries" / "2024"
+        year_dir.mkdir(parents=True)
+        week_file = year_dir / "week-48.md"
+        week_file.write_bytes(b"# Week 48 - 2024\r\n\r\n## 2024-11-25\r\n### Existing entry\r\n- **Topic:** Test\r\n")
+        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+
+        add_entry(Entry(title="New entry", topic="Test", impact="Test", entry_date=date(2024, 11, 26)))
+
+        assert week_file.read_bytes() == (
+            b"# Week 48 - 2024\n\n## 2024-11-25\n### Existing entry\n- **Topic:** Test\n"
+            b"\n## 2024-11-26\n### New entry\n- **Topic:** Test\n- **Impact:** Test\n"
+        )
+
+    def test_add_entry_normalizes_trailing_whitespace(self, monkeypatch, tmp_path):
+        """Trailing blank lines are trimmed before the entry is added."""
+        brag_dir = tmp_path / "brag"
+        entries_dir = brag_dir / "entries"
+        year_dir = entries_dir / "2024"
+        year_dir.mkdir(parents=True)
+        week_file = year_dir / "week-48.md"
+        week_file.write_text("# Week 48 - 2024\n\n## 2024-11-25\n### Existing entry\n- **Topic:** Test\n- **Impact:** Test\n\n\n")
+        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+
+        add_entry(
+            Entry(
+                title="New entry",
+                topic="Test",
+                impact="Test",
+                entry_date=date(2024, 11, 25),
+            )
+        )
+
+        assert week_file.read_text().endswith(
+            "- **Impact:** Test\n### New entry\n- **Topic:** Test\n- **Impact:** Test\n"
+        )
+
 
 class TestParseWeekFile:
     """Tests for parse_week_file function."""
@@ -274,6 +437,51 @@ class TestParseWeekFile:
         assert result[0].entry_date == date(2024, 11, 25)
         assert result[1].entry_date == date(2024, 11, 26)
 
+    def test_parse_week_file_entry_before_first_date(self, tmp_path):
+        """An entry before the first date header takes that date."""
+        file_path = tmp_path / "week-48.md"
+        content = """# Week 48 - 2024
+
+### Undated entry
+- **Topic:** Topic1
+- **Impact:** Impact1
+
+## 2024-11-25
+### Monday entry
+- **Topic:** Topic2
+- **Impact:** Impact2
+"""
+        file_path.write_text(content)
+
+        result = parse_week_file(file_path)
+
+        assert [(e.title, e.topic, e.entry_date) for e in result] == [
+            ("Undated entry", "Topic1", date(2024, 11, 25)),
+            ("Monday entry", "Topic2", date(2024, 11, 25)),
+        ]
+
+    def test_parse_week_file_picks_up_changes(self, tmp_path):
+        """Re-parse the file once it has been modified."""
+        file_path = tmp_path / "week-48.md"
+        file_path.write_text("""# Week 48 - 2024
+
+## 2024-11-25
+### First entry
+- **Topic:** Topic1
+- **Impact:** Impact1
+""")
+        assert len(parse_week_file(file_path)) == 1
+
+        with open(file_path, "a") as f:
+            f.write("""
+### Second entry
+- **Topic:** Topic2
+- **Impact:** Impact2
+""")
+        result = parse_week_file(file_path)
+
+        assert [e.title for e in result] == ["First entry", "Second entry"]
+
 
 class TestGetWeeksInRange:
     """Tests for get_weeks_in_range function."""
@@ -304,199 +512,102 @@ class TestGetWeeksInRange:
 class TestGetEntriesForWeek:
     """Tests for get_entries_for_week function."""
 
-    def test_get_entries_for_week(self, monkeypatch, tmp_path):
+    def test_get_entries_for_week(self, brag_env):
         """Retrieve entries for specific week."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        year_dir = entries_dir / "2024"
-        year_dir.mkdir(parents=True)
-        week_file = year_dir / "week-48.md"
-        content = """# Week 48 - 2024
-
-## 2024-11-25
-### Test entry
-- **Topic:** Topic
-- **Impact:** Impact
-"""
-        week_file.write_text(content)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = get_entries_for_week(2024, 48)
+        result = get_entries_for_week(2024, 47)
 
         assert len(result) == 1
-        assert result[0].title == "Test entry"
+        assert result[0].title == "November entry"
 
 
 class TestGetEntriesFiltered:
     """Tests for get_entries_filtered function."""
 
     @freeze_time("2024-11-25")
-    def test_get_entries_filtered_current_week_default(self, monkeypatch, tmp_path):
+    def test_get_entries_filtered_current_week_default(self, brag_env):
         """Default to current week."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        year_dir = entries_dir / "2024"
-        year_dir.mkdir(parents=True)
-        week_file = year_dir / "week-48.md"
-        content = """# Week 48 - 2024
-
-## 2024-11-25
-### Test entry
-- **Topic:** Topic
-- **Impact:** Impact
-"""
-        week_file.write_text(content)
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
         result = get_entries_filtered()
 
-        assert len(result) == 1
-        assert result[0].title == "Test entry"
+        assert [e.title for e in result] == ["Alpha entry", "Beta entry", "Street work"]
 
-    def test_get_entries_filtered_by_week(self, monkeypatch, tmp_path):
-        """Filter by specific week."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        year_dir = entries_dir / "2024"
-        year_dir.mkdir(parents=True)
-        week48 = year_dir / "week-48.md"
-        week48.write_text("""# Week 48 - 2024
-
-## 2024-11-25
-### Week 48 entry
-- **Topic:** Topic
-- **Impact:** Impact
-""")
-        week49 = year_dir / "week-49.md"
-        week49.write_text("""# Week 49 - 2024
-
-## 2024-12-02
-### Week 49 entry
-- **Topic:** Topic
-- **Impact:** Impact
-""")
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = get_entries_filtered(year=2024, week=48)
-
-        assert len(result) == 1
-        assert result[0].title == "Week 48 entry"
-
-    def test_get_entries_filtered_by_month(self, monkeypatch, tmp_path):
-        """Filter by month."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        year_dir = entries_dir / "2024"
-        year_dir.mkdir(parents=True)
-        # November entries (week 44-48)
-        week47 = year_dir / "week-47.md"
-        week47.write_text("""# Week 47 - 2024
-
-## 2024-11-18
-### November entry
-- **Topic:** Topic
-- **Impact:** Impact
-""")
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = get_entries_filtered(year=2024, month=11)
-
-        assert len(result) == 1
-        assert result[0].title == "November entry"
-
-    def test_get_entries_filtered_by_quarter(self, monkeypatch, tmp_path):
-        """Filter by quarter (Q1-Q4)."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        year_dir = entries_dir / "2024"
-        year_dir.mkdir(parents=True)
-        # Q4 = October-December (months 10-12)
-        week44 = year_dir / "week-44.md"
-        week44.write_text("""# Week 44 - 2024
-
-## 2024-10-28
-### October entry
-- **Topic:** Topic
-- **Impact:** Impact
-""")
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = get_entries_filtered(year=2024, quarter=4)
-
-        assert len(result) == 1
-        assert result[0].title == "October entry"
-
-    def test_get_entries_filtered_by_semester(self, monkeypatch, tmp_path):
-        """Filter by semester (1-2)."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        year_dir = entries_dir / "2024"
-        year_dir.mkdir(parents=True)
-        # Semester 2 = July-December
-        week44 = year_dir / "week-44.md"
-        week44.write_text("""# Week 44 - 2024
-
-## 2024-10-28
-### Second semester entry
-- **Topic:** Topic
-- **Impact:** Impact
-""")
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
-
-        result = get_entries_filtered(year=2024, semester=2)
-
-        assert len(result) == 1
-        assert result[0].title == "Second semester entry"
-
-    def test_get_entries_filtered_by_topic(self, monkeypatch, tmp_path):
-        """Filter by topic (case-insensitive)."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        year_dir = entries_dir / "2024"
-        year_dir.mkdir(parents=True)
-        week48 = year_dir / "week-48.md"
-        week48.write_text("""# Week 48 - 2024
-
-## 2024-11-25
-### Alpha entry
-- **Topic:** Project Alpha
-- **Impact:** Impact
+    @pytest.mark.parametrize(
+        "filters,expected",
+        [
+            ({"week": 48}, ["Alpha entry", "Beta entry", "Street work"]),
+            ({"month": 11}, ["November entry", "Alpha entry", "Beta entry", "Street work"]),
+            # December's last ISO week is week 1 of 2025
+            ({"month": 12}, ["Week 49 entry", "Year end entry"]),
+            (
+                {"quarter": 4},
+                [
+                    "October entry",
+                    "November entry",
+                    "Alpha entry",
+                    "Beta entry",
+                    "Street work",
+                    "Week 49 entry",
+                    "Year end entry",
+                ],
+            ),
+            (
+                {"semester": 2},
+                [
+                    "July entry",
+                    "October entry",
+                    "November entry",
+                    "Alpha entry",
+                    "Beta entry",
+                    "Street work",
+                    "Week 49 entry",
+                    "Year end entry",
+                ],
+            ),
+            ({"semester": 1}, ["March entry"]),
+            # Topic matching is case-insensitive
+            ({"week": 48, "topic": "project alpha"}, ["Alpha entry"]),
+            ({"week": 48, "topic": "STRASSE"}, ["Street work"]),
+            ({"month": 11, "topic": "Project Beta"}, ["Beta entry"]),
+        ],
+        ids=[
+            "week",
+            "month",
+            "month_across_year_boundary",
+            "quarter",
+            "semester",
+            "first_semester",
+            "topic",
+            "topic_casefold",
+            "combined",
+        ],
+    )
+    def test_get_entries_filtered(self, brag_env, filters, expected):
+        """Filters select the matching entries in date order."""
+        result = get_entries_filtered(year=2024, **filters)
 
-### Beta entry
-- **Topic:** Project Beta
-- **Impact:** Impact
-""")
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+        assert [e.title for e in result] == expected
 
-        result = get_entries_filtered(year=2024, week=48, topic="project alpha")
+    def test_get_entries_filtered_january_in_previous_iso_year(self, monkeypatch, tmp_path):
+        """Early January days in the previous ISO year's last week are found."""
+        monkeypatch.setenv("BRAG_DIR", str(tmp_path / "brag"))
+        # January 1, 2027 is in week 53 of 2026
+        add_entry(Entry(title="New year", topic="Topic", impact="Impact", entry_date=date(2027, 1, 1)))
+        add_entry(Entry(title="Later", topic="Topic", impact="Impact", entry_date=date(2027, 1, 4)))
 
-        assert len(result) == 1
-        assert result[0].title == "Alpha entry"
+        result = get_entries_filtered(year=2027, month=1)
 
-    def test_get_entries_filtered_combined(self, monkeypatch, tmp_path):
-        """Combine multiple filters."""
-        brag_dir = tmp_path / "brag"
-        entries_dir = brag_dir / "entries"
-        year_dir = entries_dir / "2024"
-        year_dir.mkdir(parents=True)
-        week48 = year_dir / "week-48.md"
-        week48.write_text("""# Week 48 - 2024
+        assert [e.title for e in result] == ["New year", "Later"]
 
-## 2024-11-25
-### Target entry
-- **Topic:** Project Alpha
-- **Impact:** Impact
 
-### Other entry
-- **Topic:** Project Beta
-- **Impact:** Impact
-""")
-        monkeypatch.setenv("BRAG_DIR", str(brag_dir))
+class TestExistingWeeks:
+    """Tests for _existing_weeks function."""
 
-        result = get_entries_filtered(year=2024, week=48, topic="Project Alpha")
+    def test_existing_weeks(self, brag_env):
+        """Only week files in the year directory are reported."""
+        assert _existing_weeks(2024) == {1, 10, 27, 44, 47, 48, 49}
 
-        assert len(result) == 1
-        assert result[0].title == "Target entry"
+    def test_existing_weeks_missing_year(self, brag_env):
+        """Return an empty set when the year directory doesn't exist."""
+        assert _existing_weeks(2023) == set()
 
 
 class TestGetWeeksForMonth:
@@ -510,6 +621,12 @@ class TestGetWeeksForMonth:
         assert (2024, 44) in result
         assert (2024, 48) in result
 
+    def test_get_weeks_for_month_sorted_tuple(self):
+        """Return weeks as a sorted tuple, safe to share from the cache."""
+        result = _get_weeks_for_month(2024, 11)
+
+        assert result == ((2024, 44), (2024, 45), (2024, 46), (2024, 47), (2024, 48))
+
     def test_get_weeks_for_month_year_boundary(self):
         """Handle December/January edge case."""
         # December 2024 includes week 1 of 2025